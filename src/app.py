@@ -6,18 +6,38 @@ for extracurricular activities at Mergington High School.
 """
 
 from fastapi import FastAPI, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
-import os
+from fastapi.responses import RedirectResponse, Response
+import json
 from pathlib import Path
 
 app = FastAPI(title="Mergington High School API",
               description="API for viewing and signing up for extracurricular activities")
 
+# Compress API and static responses; the payloads are repetitive text. The
+# cached /activities body is recompressed per request, which costs little at
+# its couple of kilobytes compared to caching one encoding per Accept-Encoding
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
+
+class CachedStaticFiles(StaticFiles):
+    """Static files that let browsers reuse scripts and styles for an hour"""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope,
+                                         status_code)
+        # Asset names are not content-hashed, so keep pages revalidating and
+        # bound how long an outdated script or stylesheet can be served
+        if not str(full_path).endswith(".html"):
+            response.headers["cache-control"] = "public, max-age=3600"
+        return response
+
+
 # Mount the static files directory
 current_dir = Path(__file__).parent
-app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
-          "static")), name="static")
+app.mount("/static", CachedStaticFiles(directory=current_dir / "static"),
+          name="static")
 
 # In-memory activity database
 activities = {
@@ -78,26 +98,44 @@ activities = {
 }
 
 
+# Serialized /activities payload, rebuilt on the next read after a change
+activities_body = None
+
+
+def invalidate_activities_cache():
+    """Drop the cached /activities payload; call after every write to activities"""
+    global activities_body
+    activities_body = None
+
+
 @app.get("/")
-def root():
+async def root():
     return RedirectResponse(url="/static/index.html")
 
 
 @app.get("/activities")
-def get_activities():
-    return activities
+async def get_activities():
+    global activities_body
+    if activities_body is None:
+        activities_body = json.dumps(activities, ensure_ascii=False,
+                                     separators=(",", ":")).encode()
+    return Response(content=activities_body, media_type="application/json")
+
+
+@app.get("/activities/names")
+async def get_activity_names():
+    """List activity names without their details"""
+    return list(activities)
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+async def signup_for_activity(activity_name: str, email: str):
     """Sign up a student for an activity"""
-    # Validate activity exists
-    if activity_name not in activities:
+    # Get the specific activity, validating it exists
+    activity = activities.get(activity_name)
+    if activity is None:
         raise HTTPException(status_code=404, detail="Activity not found")
 
-    # Get the specific activity
-    activity = activities[activity_name]
-
     # Validate student is not already signed up
     if email in activity["participants"]:
         raise HTTPException(
@@ -105,21 +143,27 @@ def signup_for_activity(activity_name: str, email: str):
             detail="Student is already signed up"
         )
 
+    # Validate the activity is not full
+    if len(activity["participants"]) >= activity["max_participants"]:
+        raise HTTPException(
+            status_code=400,
+            detail="Activity is full"
+        )
+
     # Add student
     activity["participants"].append(email)
+    invalidate_activities_cache()
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
 @app.delete("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
+async def unregister_from_activity(activity_name: str, email: str):
     """Unregister a student from an activity"""
-    # Validate activity exists
-    if activity_name not in activities:
+    # Get the specific activity, validating it exists
+    activity = activities.get(activity_name)
+    if activity is None:
         raise HTTPException(status_code=404, detail="Activity not found")
 
-    # Get the specific activity
-    activity = activities[activity_name]
-
     # Validate student is signed up
     if email not in activity["participants"]:
         raise HTTPException(
@@ -129,4 +173,5 @@ def unregister_from_activity(activity_name: str, email: str):
 
     # Remove student
     activity["participants"].remove(email)
+    invalidate_activities_cache()
     return {"message": f"Unregistered {email} from {activity_name}"}